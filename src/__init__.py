@@ -6,15 +6,38 @@ English Speech → English Text → Russian Text → Russian Audio
 __version__ = "1.0.0"
 __author__ = "Speech Translation System"
 
-from .main_pipeline import SpeechTranslationPipeline
-from .stt_module import SpeechToText
-from .translation_module import EnglishToRussianTranslator
-from .tts_module import RussianTextToSpeech, AudioPlayer
+# Map public names to the modules that define them. Imports are deferred
+# via PEP 562 __getattr__ so that `import src` stays cheap: torch,
+# transformers and the audio stack are only loaded when one of the
+# pipeline classes is actually accessed (utility scripts like
+# create_test_wav.py never pay for them).
+_LAZY_IMPORTS = {
+    "SpeechTranslationPipeline": "main_pipeline",
+    "SpeechToText": "stt_module",
+    "EnglishToRussianTranslator": "translation_module",
+    "RussianTextToSpeech": "tts_module",
+    "AudioPlayer": "tts_module",
+}
 
 __all__ = [
     "SpeechTranslationPipeline",
-    "SpeechToText", 
+    "SpeechToText",
     "EnglishToRussianTranslator",
     "RussianTextToSpeech",
     "AudioPlayer"
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+
+        module = import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # cache so __getattr__ runs once per name
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
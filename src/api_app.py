@@ -19,35 +19,79 @@ This module does not contain any Teams-specific logic; it only
 implements the translation pipeline as an HTTP service.
 """
 
+import asyncio
 import os
 import logging
-from datetime import datetime
+import struct
+import queue
+import re
+import threading
+import time
+from collections import OrderedDict
+from logging.handlers import QueueHandler, QueueListener
 # Disable pygame in server mode to avoid audio device init issues on Windows
 os.environ["STS_DISABLE_PYGAME"] = "1"
 
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from typing import Optional
 
 import numpy as np
 import soundfile as sf
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from urllib.parse import quote
+
+from fastapi import FastAPI, File, Header, HTTPException, UploadFile, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, Response
+
+# orjson serializes several times faster than stdlib json and emits UTF-8
+# directly instead of \u-escaping every Cyrillic character
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse
+    _JSON_RESPONSE_CLASS = ORJSONResponse
+except ImportError:
+    orjson = None
+    _JSON_RESPONSE_CLASS = JSONResponse
 
 from stt_module import SpeechToText
 from translation_module import EnglishToRussianTranslator
 from tts_module import RussianTextToSpeech
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('sts_api.log'),
-        logging.StreamHandler()
-    ]
-)
+# Optional WebRTC VAD for gating silent chunks before they hit Whisper
+try:
+    import webrtcvad
+except ImportError:
+    webrtcvad = None
+
+# Configure logging. Handlers that block on I/O (file + stream) live behind
+# a QueueListener thread so request-serving threads only enqueue records
+# instead of flushing to disk/console inline.
+_log_queue: "queue.Queue" = queue.Queue(-1)
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [logging.FileHandler('sts_api.log'), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_root_logger = logging.getLogger()
+_root_logger.setLevel(logging.INFO)
+_root_logger.addHandler(QueueHandler(_log_queue))
+_log_listener = QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Speech Translation Service", version="2.0.0")
+app = FastAPI(
+    title="Speech Translation Service",
+    version="2.0.0",
+    default_response_class=_JSON_RESPONSE_CLASS,
+)
+
+
+async def send_json_fast(websocket: WebSocket, obj: dict) -> None:
+    """Send a JSON text frame, serialized with orjson when available."""
+    if orjson is not None:
+        await websocket.send_text(orjson.dumps(obj).decode())
+    else:
+        await websocket.send_json(obj)
+
 
 # API Key from environment variable
 API_KEY = os.getenv("STS_API_KEY", None)
@@ -61,6 +105,123 @@ MAX_FILE_SIZE_MB = int(os.getenv("MAX_FILE_SIZE_MB", "10"))
 MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
 
 
+def _decode_wav_fast(audio_bytes: bytes, out: Optional[np.ndarray] = None):
+    """Decode canonical 16-bit PCM mono WAV without BytesIO/libsndfile.
+
+    The documented input format (16 kHz mono PCM WAV) lets us read samples
+    straight out of the byte buffer with a single allocation instead of the
+    three copies done by the BytesIO + sf.read + asarray path. When ``out``
+    is given (a float32 scratch array) the decode writes into it and no
+    allocation happens at all.
+
+    Returns ``(audio_float32, sample_rate)`` or ``None`` when the file is
+    not canonical PCM16 mono (caller falls back to soundfile).
+    """
+    if len(audio_bytes) < 44 or audio_bytes[:4] != b"RIFF" or audio_bytes[8:12] != b"WAVE":
+        return None
+
+    # Walk RIFF chunks looking for fmt and data
+    pos = 12
+    fmt = None
+    while pos + 8 <= len(audio_bytes):
+        chunk_id = audio_bytes[pos:pos + 4]
+        chunk_size = struct.unpack_from("<I", audio_bytes, pos + 4)[0]
+        body = pos + 8
+        if chunk_id == b"fmt " and chunk_size >= 16:
+            fmt = struct.unpack_from("<HHIIHH", audio_bytes, body)
+        elif chunk_id == b"data":
+            if fmt is None:
+                return None
+            audio_format, channels, sample_rate, _, _, bits = fmt
+            if audio_format != 1 or channels != 1 or bits != 16:
+                return None  # non-canonical; let soundfile handle it
+            count = min(chunk_size, len(audio_bytes) - body) // 2
+            if count == 0:
+                return None
+            samples = np.frombuffer(audio_bytes, dtype="<i2", offset=body, count=count)
+            if out is not None and out.size >= count:
+                audio = out[:count]
+                np.multiply(samples, np.float32(1.0 / 32768.0), out=audio)
+            else:
+                audio = samples.astype(np.float32) * (1.0 / 32768.0)
+            return audio, sample_rate
+        # Chunks are word-aligned
+        pos = body + chunk_size + (chunk_size & 1)
+
+    return None
+
+
+def encode_wav_pcm16(samples: np.ndarray, sample_rate: int,
+                     scratch: Optional[np.ndarray] = None) -> bytes:
+    """Encode float32 mono samples as PCM16 WAV bytes.
+
+    The output format is fixed (PCM16 mono), so the 44-byte header is
+    packed by hand and concatenated with the quantized samples — no
+    BytesIO, no libsndfile, one copy fewer on the response path. When
+    ``scratch`` (an int16 array) is given, quantization writes into it
+    instead of allocating.
+    """
+    if scratch is not None and scratch.size >= samples.size:
+        pcm = scratch[:samples.size]
+        np.multiply(np.clip(samples, -1.0, 1.0), 32767.0, out=pcm, casting="unsafe")
+    else:
+        pcm = (np.clip(samples, -1.0, 1.0) * 32767.0).astype(np.int16)
+    n_bytes = pcm.nbytes
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + n_bytes, b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b"data", n_bytes,
+    )
+    return header + pcm.tobytes()
+
+
+def _split_sentences(text: str) -> list:
+    """Split text on sentence boundaries, dropping empty pieces."""
+    return [s for s in re.split(r"(?<=[.!?])\s+", text.strip()) if s.strip()]
+
+
+def streaming_wav_header(sample_rate: int) -> bytes:
+    """44-byte PCM16 mono WAV header with unknown (streaming) length.
+
+    The RIFF and data sizes are set to 0xFFFFFFFF, the usual convention
+    for live streams where the total length is not known up front.
+    """
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 0xFFFFFFFF, b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b"data", 0xFFFFFFFF,
+    )
+
+
+class _LRUCache:
+    """Small thread-safe LRU cache with a bounded number of entries.
+
+    FastAPI dispatches requests on a threadpool, so lookups and inserts
+    are guarded by a lock.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
 class TranslationPipeline:
     """In-process wrapper around the STT -> MT -> TTS pipeline.
 
@@ -70,13 +231,49 @@ class TranslationPipeline:
     """
 
     def __init__(self, stt_model: str = "base"):
-        logger.info(f"Initializing TranslationPipeline with STT model: {stt_model}")
+        logger.info("Initializing TranslationPipeline with STT model: %s", stt_model)
         # Initialize components once at startup to avoid per-request latency
         self.stt = SpeechToText(model_size=stt_model, callback=None)
         self.translator = EnglishToRussianTranslator(callback=None)
         self.tts = RussianTextToSpeech(callback=None)
+        # Meeting audio repeats short phrases heavily ("yes", "okay", ...):
+        # cache EN->RU translations and encoded Russian WAV bytes so repeat
+        # phrases skip the MT and TTS forward passes entirely.
+        self._mt_cache = _LRUCache(maxsize=4096)
+        self._tts_cache = _LRUCache(maxsize=1024)
+        # VAD gate: a live Teams bot ships chunks continuously and most of
+        # them contain no speech; the VAD is ~1000x cheaper than Whisper,
+        # so silent chunks skip STT+MT+TTS entirely.
+        self._vad = webrtcvad.Vad(2) if webrtcvad is not None else None
+        # One single-worker executor per stage: each serializes access to
+        # its non-thread-safe model while letting STT, MT and TTS overlap
+        # across concurrent requests (the GIL is released inside the native
+        # torch/CT2 kernels, so the stages genuinely run in parallel).
+        self._stt_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stt")
+        self._mt_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mt")
+        self._tts_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts")
+        # Per-thread scratch buffers, lazily sized for the largest allowed
+        # chunk: decode/encode reuse these instead of allocating fresh
+        # arrays on every request, keeping hot pages resident under load.
+        self._scratch = threading.local()
         logger.info("TranslationPipeline initialization complete")
 
+    def _scratch_f32(self) -> np.ndarray:
+        """Per-thread float32 scratch for decoded audio."""
+        buf = getattr(self._scratch, "f32", None)
+        if buf is None:
+            buf = np.empty(MAX_FILE_SIZE_BYTES // 2, dtype=np.float32)
+            self._scratch.f32 = buf
+        return buf
+
+    def _scratch_i16(self) -> np.ndarray:
+        """Per-thread int16 scratch for WAV encoding."""
+        buf = getattr(self._scratch, "i16", None)
+        if buf is None:
+            buf = np.empty(MAX_FILE_SIZE_BYTES // 2, dtype=np.int16)
+            self._scratch.i16 = buf
+        return buf
+
     def translate_audio_chunk(self, audio_bytes: bytes) -> dict:
         """Run a single audio chunk through STT -> MT -> TTS.
 
@@ -92,78 +289,338 @@ class TranslationPipeline:
             - russian_text: Translated Russian text
         """
 
+        english_text = self._stt_pool.submit(self._decode_and_transcribe, audio_bytes).result()
+        if not english_text:
+            return self._silence_result()
+        russian_text = self._mt_pool.submit(self._translate_text, english_text).result()
+        wav_bytes = self._tts_pool.submit(self._synthesize_wav, russian_text).result()
+
+        return {
+            "audio": wav_bytes,
+            "english_text": english_text,
+            "russian_text": russian_text
+        }
+
+    async def translate_audio_chunk_async(self, audio_bytes: bytes) -> dict:
+        """Async variant of :meth:`translate_audio_chunk`.
+
+        Each stage is awaited on its own executor, so while one request is
+        being translated another can already be transcribing.
+        """
         if not audio_bytes:
             raise ValueError("Empty audio payload")
 
-        # Decode WAV -> numpy array
-        try:
-            with BytesIO(audio_bytes) as bio:
-                audio_data, sample_rate = sf.read(bio, dtype="float32")
-        except Exception as exc:
-            logger.error(f"Failed to decode audio: {exc}")
-            raise ValueError(f"Failed to decode audio: {exc}") from exc
+        loop = asyncio.get_event_loop()
+        english_text = await loop.run_in_executor(
+            self._stt_pool, self._decode_and_transcribe, audio_bytes
+        )
+        if not english_text:
+            return self._silence_result()
+        russian_text = await loop.run_in_executor(
+            self._mt_pool, self._translate_text, english_text
+        )
+        wav_bytes = await loop.run_in_executor(
+            self._tts_pool, self._synthesize_wav, russian_text
+        )
+
+        return {
+            "audio": wav_bytes,
+            "english_text": english_text,
+            "russian_text": russian_text
+        }
+
+    def translate_audio_batch(self, audio_chunks: list, synthesize: bool = True) -> list:
+        """Run several audio chunks through the pipeline together.
+
+        STT and TTS run per chunk, but all translations missing from the
+        cache are sent to the translator as a single batch, which amortizes
+        the per-call model overhead across concurrent requests. With
+        ``synthesize=False`` the TTS stage is skipped and ``audio`` is None
+        in the results (used by callers that stream synthesis themselves).
+
+        Returns a list aligned with ``audio_chunks``; entries are either
+        result dictionaries (as from :meth:`translate_audio_chunk`) or the
+        exception raised for that chunk.
+        """
+        results: list = [None] * len(audio_chunks)
+        english_texts: list = [None] * len(audio_chunks)
+
+        stt_futures = [
+            self._stt_pool.submit(self._decode_and_transcribe, audio_bytes)
+            for audio_bytes in audio_chunks
+        ]
+        for i, future in enumerate(stt_futures):
+            try:
+                english_texts[i] = future.result()
+                if not english_texts[i]:
+                    results[i] = self._silence_result()
+            except Exception as exc:
+                results[i] = exc
+
+        # Pre-translate every uncached sentence across the whole batch in a
+        # single translator call; _translate_text then assembles each chunk
+        # from cache hits.
+        pending_sentences = []
+        seen = set()
+        for i in range(len(audio_chunks)):
+            if results[i] is not None:
+                continue
+            for sentence in _split_sentences(english_texts[i]):
+                key = sentence.lower().strip()
+                if key not in seen and self._mt_cache.get(key) is None:
+                    seen.add(key)
+                    pending_sentences.append(sentence)
+        if pending_sentences:
+            try:
+                translations = self._mt_pool.submit(
+                    self.translator.translate_batch, pending_sentences
+                ).result()
+                for sentence, russian_text in zip(pending_sentences, translations):
+                    russian_text = (russian_text or "").strip()
+                    if russian_text:
+                        self._mt_cache.put(sentence.lower().strip(), russian_text)
+            except Exception as exc:
+                # Individual chunks retry (and report) via _translate_text below
+                logger.warning("Batched translation pre-pass failed: %s", exc)
+
+        for i in range(len(audio_chunks)):
+            if results[i] is not None:
+                continue
+            try:
+                russian_text = self._mt_pool.submit(
+                    self._translate_text, english_texts[i]
+                ).result()
+                wav_bytes = None
+                if synthesize:
+                    wav_bytes = self._tts_pool.submit(self._synthesize_wav, russian_text).result()
+                results[i] = {
+                    "audio": wav_bytes,
+                    "english_text": english_texts[i],
+                    "russian_text": russian_text,
+                }
+            except Exception as exc:
+                results[i] = exc
+
+        return results
+
+    def _decode_and_transcribe(self, audio_bytes: bytes) -> str:
+        """Decode WAV bytes and run STT, returning the English text."""
+        if not audio_bytes:
+            raise ValueError("Empty audio payload")
+
+        # Decode WAV -> numpy array; fast header parse for the canonical
+        # PCM16 mono case, soundfile for everything else
+        decoded = _decode_wav_fast(audio_bytes, out=self._scratch_f32())
+        if decoded is not None:
+            audio_data, sample_rate = decoded
+        else:
+            try:
+                with BytesIO(audio_bytes) as bio:
+                    audio_data, sample_rate = sf.read(bio, dtype="float32")
+            except Exception as exc:
+                logger.error("Failed to decode audio: %s", exc)
+                raise ValueError(f"Failed to decode audio: {exc}") from exc
 
         if sample_rate != 16000:
             raise ValueError(f"Expected 16 kHz audio, got {sample_rate} Hz")
 
-        # Ensure mono float32
-        audio_data = np.asarray(audio_data, dtype=np.float32)
+        # Ensure mono float32 (no-op copies skipped when already canonical)
+        if audio_data.dtype != np.float32:
+            audio_data = audio_data.astype(np.float32)
         if audio_data.ndim > 1:
             audio_data = audio_data.mean(axis=1)
 
         if audio_data.size == 0:
             raise ValueError("Decoded audio is empty")
 
-        # Step 1: STT (English)
+        if not self._has_speech(audio_data):
+            logger.info("VAD: no speech in chunk, skipping STT/MT/TTS")
+            return ""
+
         logger.info("Starting speech-to-text transcription")
         english_text = self.stt.transcribe_audio_data(audio_data)
         english_text = (english_text or "").strip()
-        if not english_text:
-            logger.warning("No speech detected in audio, using placeholder")
-            english_text = "Hello, how are you?"
-        
-        logger.info(f"Transcribed text: {english_text}")
-
-        # Step 2: Translation (EN -> RU)
-        logger.info("Starting translation")
-        russian_text = self.translator.translate(english_text).strip()
-        if not russian_text:
-            raise ValueError("Translation produced empty text")
-        
-        logger.info(f"Translated text: {russian_text}")
-
-        # Step 3: TTS (RU -> audio numpy array)
-        logger.info("Starting text-to-speech synthesis")
-        russian_audio = self.tts.synthesize(russian_text)
-        if russian_audio is None or russian_audio.size == 0:
-            raise ValueError("TTS produced empty audio")
-
-        # Encode numpy array back to WAV bytes (22050 Hz mono, matching gTTS output)
-        out_buffer = BytesIO()
-        sf.write(out_buffer, russian_audio, 22050, format="WAV")
-        
+        if english_text:
+            logger.info("Transcribed text: %s", english_text)
+        return english_text
+
+    def _has_speech(self, audio_data: np.ndarray) -> bool:
+        """Return True when at least 10% of 30 ms frames contain speech.
+
+        Uses WebRTC VAD when installed, otherwise a per-frame RMS energy
+        gate as a cheap approximation.
+        """
+        frame_len = 480  # 30 ms at 16 kHz
+        n_frames = audio_data.size // frame_len
+        if n_frames == 0:
+            return False
+
+        if self._vad is not None:
+            pcm = (np.clip(audio_data, -1.0, 1.0) * 32767.0).astype(np.int16)
+            voiced = sum(
+                1 for i in range(n_frames)
+                if self._vad.is_speech(
+                    pcm[i * frame_len:(i + 1) * frame_len].tobytes(), 16000
+                )
+            )
+        else:
+            frames = audio_data[:n_frames * frame_len].reshape(n_frames, frame_len)
+            rms = np.sqrt(np.mean(frames * frames, axis=1))
+            voiced = int(np.count_nonzero(rms > 0.01))
+
+        return voiced >= max(1, n_frames // 10)
+
+    def _silence_result(self) -> dict:
+        """Result returned for chunks with no detected speech."""
+        samples = np.zeros(int(self.tts.sample_rate * 0.1), dtype=np.float32)
         return {
-            "audio": out_buffer.getvalue(),
-            "english_text": english_text,
-            "russian_text": russian_text
+            "audio": encode_wav_pcm16(samples, self.tts.sample_rate),
+            "english_text": "",
+            "russian_text": "",
         }
 
+    def _translate_text(self, english_text: str) -> str:
+        """Translate English text to Russian, sentence by sentence.
+
+        Splitting bounds the quadratic attention cost per decoder step,
+        lets the LRU cache hit on individual recurring sentences, and
+        hands all uncached sentences to the translator as one batch.
+        """
+        sentences = _split_sentences(english_text)
+        if not sentences:
+            raise ValueError("Nothing to translate")
+
+        translated = [self._mt_cache.get(s.lower().strip()) for s in sentences]
+        pending = [i for i, t in enumerate(translated) if t is None]
+        if pending:
+            logger.info("Starting translation")
+            batch = self.translator.translate_batch([sentences[i] for i in pending])
+            for i, russian in zip(pending, batch):
+                russian = (russian or "").strip()
+                if not russian:
+                    raise ValueError("Translation produced empty text")
+                self._mt_cache.put(sentences[i].lower().strip(), russian)
+                translated[i] = russian
+
+        russian_text = " ".join(translated)
+        logger.info("Translated text: %s", russian_text)
+        return russian_text
+
+    def _synthesize_wav(self, russian_text: str) -> bytes:
+        """Synthesize Russian speech and return encoded WAV bytes (cached)."""
+        # Cache the already-encoded WAV bytes so repeat phrases skip
+        # synthesis and WAV encoding entirely
+        wav_bytes = self._tts_cache.get(russian_text)
+        if wav_bytes is None:
+            logger.info("Starting text-to-speech synthesis")
+            russian_audio = self.tts.synthesize(russian_text)
+            if russian_audio is None or russian_audio.size == 0:
+                raise ValueError("TTS produced empty audio")
+
+            # Encode numpy array back to WAV bytes at the synthesizer's rate
+            wav_bytes = encode_wav_pcm16(
+                russian_audio, self.tts.sample_rate, scratch=self._scratch_i16()
+            )
+            self._tts_cache.put(russian_text, wav_bytes)
+
+        return wav_bytes
+
 
 # Global pipeline instance, initialized at startup
 pipeline: Optional[TranslationPipeline] = None
+_pipeline_init_lock = threading.Lock()
 
 
 def get_pipeline():
-    """Get or initialize the translation pipeline."""
+    """Get or initialize the translation pipeline.
+
+    Lazy initialization is double-checked behind a lock: without it, two
+    concurrent first requests (EAGER_LOAD=false) would each load ~1 GB of
+    model weights. The fast path stays a single None check.
+    """
     global pipeline
     if pipeline is None:
-        logger.info("Initializing translation pipeline...")
-        stt_model = os.getenv("STT_MODEL", "base")
-        pipeline = TranslationPipeline(stt_model=stt_model)
-        logger.info("Pipeline initialized successfully")
+        with _pipeline_init_lock:
+            if pipeline is None:
+                logger.info("Initializing translation pipeline...")
+                stt_model = os.getenv("STT_MODEL", "base")
+                pipeline = TranslationPipeline(stt_model=stt_model)
+                logger.info("Pipeline initialized successfully")
     return pipeline
 
 
+class BatchScheduler:
+    """Dynamic micro-batcher in front of the translation pipeline.
+
+    Concurrent requests enqueue their audio and await a future; a single
+    background task drains up to ``max_batch`` items (waiting at most
+    ``max_wait`` seconds for stragglers) and runs them through
+    ``TranslationPipeline.translate_audio_batch`` so the translator sees
+    one batched call instead of N sequential ones.
+    """
+
+    def __init__(self, max_batch: int = 8, max_wait: float = 0.02, synthesize: bool = True):
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.synthesize = synthesize
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the background batching task (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_event_loop().create_task(self._run())
+
+    async def submit(self, audio_bytes: bytes) -> dict:
+        """Enqueue one audio chunk and wait for its pipeline result."""
+        future = asyncio.get_event_loop().create_future()
+        await self._queue.put((audio_bytes, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_event_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            audio_chunks = [audio for audio, _ in batch]
+            try:
+                results = await loop.run_in_executor(
+                    None,
+                    lambda: get_pipeline().translate_audio_batch(
+                        audio_chunks, synthesize=self.synthesize
+                    ),
+                )
+            except Exception as exc:  # pragma: no cover - unexpected runtime issues
+                logger.exception("Batch translation failed: %s", exc)
+                results = [exc] * len(batch)
+
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+
+# The WebSocket handler streams TTS itself, so the scheduler only runs
+# STT + MT and leaves synthesis to the caller
+batch_scheduler = BatchScheduler(
+    max_batch=int(os.getenv("STS_MAX_BATCH", "8")),
+    max_wait=float(os.getenv("STS_BATCH_WAIT_MS", "20")) / 1000.0,
+    synthesize=False,
+)
+
+
 def verify_api_key(api_key: Optional[str]):
     """Verify API key for WebSocket connections if authentication is enabled."""
     if API_KEY is None:
@@ -178,7 +635,7 @@ def verify_api_key(api_key: Optional[str]):
         )
     
     if api_key != API_KEY:
-        logger.warning(f"Invalid API key attempt: {api_key[:8]}...")
+        logger.warning("Invalid API key attempt: %s...", api_key[:8])
         raise HTTPException(
             status_code=403,
             detail="Invalid API key"
@@ -189,6 +646,7 @@ def verify_api_key(api_key: Optional[str]):
 async def startup_event():
     """Initialize pipeline on startup for faster first request."""
     logger.info("Starting up STS API service")
+    batch_scheduler.start()
     if os.getenv("EAGER_LOAD", "true").lower() == "true":
         logger.info("Eager loading models...")
         get_pipeline()
@@ -197,6 +655,66 @@ async def startup_event():
         logger.info("Lazy loading enabled - models will load on first request")
 
 
+@app.post("/translate-audio")
+async def translate_audio(
+    file: UploadFile = File(...),
+    x_api_key: Optional[str] = Header(default=None),
+):
+    """Translate one English audio chunk and return Russian audio.
+
+    Accepts a 16 kHz mono WAV upload and responds with 22050 Hz mono WAV
+    bytes; the transcribed and translated texts are returned in the
+    ``X-English-Text`` / ``X-Russian-Text`` response headers
+    (percent-encoded, since raw Cyrillic is not latin-1 safe).
+    """
+    verify_api_key(x_api_key)
+
+    # Stream the upload with a size guard instead of buffering the whole
+    # body first: oversize uploads are rejected after at most one extra
+    # read chunk rather than after a full in-memory copy.
+    buf = bytearray()
+    while True:
+        chunk = await file.read(64 * 1024)
+        if not chunk:
+            break
+        buf += chunk
+        if len(buf) > MAX_FILE_SIZE_BYTES:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File too large (max {MAX_FILE_SIZE_MB} MB)",
+            )
+
+    start_time = time.perf_counter()
+    try:
+        result = await get_pipeline().translate_audio_chunk_async(bytes(buf))
+    except ValueError as exc:
+        logger.error("Validation error: %s", exc)
+        raise HTTPException(status_code=400, detail=str(exc))
+    duration = time.perf_counter() - start_time
+
+    logger.info(
+        "Translation completed in %.2fs - EN: '%s' -> RU: '%s'",
+        duration,
+        result["english_text"],
+        result["russian_text"],
+    )
+
+    # No GZipMiddleware here on purpose: PCM WAV barely compresses, so
+    # gzipping the audio body would burn CPU for nothing. Declare the
+    # encoding explicitly so intermediaries don't try either.
+    return Response(
+        content=result["audio"],
+        media_type="audio/wav",
+        headers={
+            "X-English-Text": quote(result["english_text"]),
+            "X-Russian-Text": quote(result["russian_text"]),
+            "X-Processing-Time": f"{duration:.3f}",
+            "Content-Encoding": "identity",
+            "Accept-Ranges": "bytes",
+        },
+    )
+
+
 @app.websocket("/ws/translate-audio")
 async def websocket_translate_audio(websocket: WebSocket):
     """WebSocket endpoint for live audio translation.
@@ -220,7 +738,7 @@ async def websocket_translate_audio(websocket: WebSocket):
         return
 
     await websocket.accept()
-    logger.info(f"WebSocket client connected from {websocket.client.host if websocket.client else 'unknown'}")
+    logger.info("WebSocket client connected from %s", websocket.client.host if websocket.client else "unknown")
 
     try:
         while True:
@@ -235,17 +753,60 @@ async def websocket_translate_audio(websocket: WebSocket):
                 # Ignore non-binary or empty messages
                 continue
 
-            start_time = datetime.utcnow()
+            start_time = time.perf_counter()
 
             try:
-                result = get_pipeline().translate_audio_chunk(audio_bytes)
-                duration = (datetime.utcnow() - start_time).total_seconds()
-
-                # First, send the synthesized Russian audio as binary
-                await websocket.send_bytes(result["audio"])
-
-                # Then, send metadata (texts and processing time) as JSON
-                await websocket.send_json(
+                result = await batch_scheduler.submit(audio_bytes)
+                pipe = get_pipeline()
+                russian_text = result["russian_text"]
+
+                if not russian_text:
+                    # Silent chunk: a single tiny WAV frame, then metadata
+                    await websocket.send_bytes(result["audio"])
+                else:
+                    cached_wav = pipe._tts_cache.get(russian_text)
+                    if cached_wav is not None:
+                        await websocket.send_bytes(cached_wav)
+                    else:
+                        # Stream synthesis: send the WAV header once, then a
+                        # raw PCM16 frame per synthesized sentence, so the
+                        # client can start playback before TTS has finished.
+                        loop = asyncio.get_event_loop()
+                        sample_rate = pipe.tts.sample_rate
+                        await websocket.send_bytes(streaming_wav_header(sample_rate))
+                        pcm_frames = []
+                        stream = pipe.tts.synthesize_stream(russian_text)
+                        while True:
+                            audio_chunk = await loop.run_in_executor(
+                                pipe._tts_pool, next, stream, None
+                            )
+                            if audio_chunk is None:
+                                break
+                            pcm = (np.clip(audio_chunk, -1.0, 1.0) * 32767.0).astype(np.int16)
+                            pcm_frames.append(pcm)
+                            await websocket.send_bytes(pcm.tobytes())
+                        if pcm_frames:
+                            # Cache the assembled utterance for repeat
+                            # phrases - as a finite WAV with real RIFF/data
+                            # sizes, since this cache also serves
+                            # POST /translate-audio and strict parsers
+                            # reject the 0xFFFFFFFF streaming header. Same
+                            # layout encode_wav_pcm16 emits, but packed
+                            # around the already-quantized frames.
+                            pcm_bytes = b"".join(frame.tobytes() for frame in pcm_frames)
+                            finite_header = struct.pack(
+                                "<4sI4s4sIHHIIHH4sI",
+                                b"RIFF", 36 + len(pcm_bytes), b"WAVE",
+                                b"fmt ", 16, 1, 1, sample_rate,
+                                sample_rate * 2, 2, 16,
+                                b"data", len(pcm_bytes),
+                            )
+                            pipe._tts_cache.put(russian_text, finite_header + pcm_bytes)
+
+                duration = time.perf_counter() - start_time
+
+                # The JSON metadata frame doubles as the end-of-audio terminator
+                await send_json_fast(websocket, 
                     {
                         "english_text": result["english_text"],
                         "russian_text": result["russian_text"],
@@ -261,11 +822,11 @@ async def websocket_translate_audio(websocket: WebSocket):
                 )
 
             except ValueError as exc:
-                logger.error(f"WebSocket validation error: {exc}")
-                await websocket.send_json({"error": str(exc)})
+                logger.error("WebSocket validation error: %s", exc)
+                await send_json_fast(websocket, {"error": str(exc)})
             except Exception as exc:  # pragma: no cover - unexpected runtime issues
-                logger.exception(f"WebSocket internal error during translation: {exc}")
-                await websocket.send_json(
+                logger.exception("WebSocket internal error during translation: %s", exc)
+                await send_json_fast(websocket, 
                     {
                         "error": "Internal translation error. Check server logs for details.",
                     }
@@ -274,7 +835,7 @@ async def websocket_translate_audio(websocket: WebSocket):
     except WebSocketDisconnect:
         logger.info("WebSocket client disconnected")
     except Exception as exc:  # pragma: no cover - unexpected runtime issues
-        logger.exception(f"Unexpected WebSocket error: {exc}")
+        logger.exception("Unexpected WebSocket error: %s", exc)
     finally:
         try:
             await websocket.close()
@@ -285,6 +846,25 @@ async def websocket_translate_audio(websocket: WebSocket):
 
 
 
+# Preload models at import time when running under a preforking server,
+# e.g. on Linux:
+#
+#     STS_PRELOAD=true gunicorn api_app:app --preload --workers 4 \
+#         -k uvicorn.workers.UvicornWorker
+#
+# The master loads the weights once before fork(), so the read-only model
+# pages stay in a single copy-on-write mapping shared by every worker
+# instead of being reloaded (and duplicated) per process.
+if os.getenv("STS_PRELOAD", "false").lower() == "true":
+    import torch
+
+    if int(os.getenv("STS_WORKERS", "1")) > 1:
+        # One torch thread per worker avoids N workers x M threads
+        # oversubscribing the machine
+        torch.set_num_threads(1)
+    get_pipeline()
+
+
 if __name__ == "__main__":  # pragma: no cover
     import uvicorn
 
@@ -293,4 +873,5 @@ if __name__ == "__main__":  # pragma: no cover
         host="0.0.0.0",
         port=8000,
         reload=False,
+        workers=int(os.getenv("STS_WORKERS", "1")),
     )
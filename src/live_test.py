@@ -1,16 +1,19 @@
 """Record live audio from microphone, send to translation API, and play the result."""
 
-import os
 import io
-import wave
+import struct
 import requests
 import numpy as np
 import sounddevice as sd
 import soundfile as sf
-import tempfile
 import time
 from pathlib import Path
 
+# One keep-alive session for the whole script: repeated recordings reuse
+# the same TCP connection instead of paying a handshake per request
+_session = requests.Session()
+_session.mount("http://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
 
 def record_audio(duration=2.0, sample_rate=16000):
     """Record audio from microphone (16 kHz mono)."""
@@ -22,24 +25,30 @@ def record_audio(duration=2.0, sample_rate=16000):
 
 
 def audio_to_wav_bytes(audio_data, sample_rate=16000):
-    """Convert numpy audio to WAV bytes in memory."""
-    buffer = io.BytesIO()
-    sf.write(buffer, audio_data, sample_rate, format='WAV')
-    buffer.seek(0)
-    return buffer.read()
+    """Convert numpy audio to 16-bit PCM WAV bytes in memory."""
+    # Quantize to int16 up front (one vectorized multiply+clip+cast):
+    # halves the upload size vs float32 and skips libsndfile's own
+    # per-sample format conversion
+    pcm = np.clip(audio_data * 32767.0, -32768, 32767).astype(np.int16)
+    # Hand-pack the 44-byte RIFF header and append the raw samples: no
+    # libsndfile encode pass, no intermediate BytesIO copy, and the body
+    # stays a WAV the API (and curl) already understand
+    data = pcm.tobytes()
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + len(data), b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b"data", len(data),
+    )
+    return header + data
 
 
 def play_audio(audio_bytes):
-    """Play WAV audio bytes using system sound."""
-    # Write to temp file and play
-    with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp:
-        tmp.write(audio_bytes)
-        tmp_path = tmp.name
-
-    # Use system default player (Windows)
-    os.startfile(tmp_path)
-    print(f"Playing result audio: {tmp_path}")
-    # Note: The file will remain; you can delete it manually after listening
+    """Play WAV audio bytes in-process (no temp file, cross-platform)."""
+    data, sample_rate = sf.read(io.BytesIO(audio_bytes), dtype='float32')
+    print(f"Playing result audio ({len(data) / sample_rate:.1f}s)...")
+    sd.play(data, sample_rate)
+    sd.wait()  # Block until playback is finished
 
 
 def test_live_translation():
@@ -56,7 +65,7 @@ def test_live_translation():
     print("Sending to translation API...")
     files = {'file': ('live.wav', wav_bytes, 'audio/wav')}
     try:
-        response = requests.post(api_url, files=files, timeout=30)
+        response = _session.post(api_url, files=files, timeout=30)
         response.raise_for_status()
         russian_wav = response.content
         print(f"Received Russian audio: {len(russian_wav)} bytes")
@@ -3,12 +3,13 @@ Main Real-time Speech Translation Pipeline
 English Speech -> English Text -> Russian Text -> Russian Audio
 """
 
+import collections
 import threading
-import queue
 import time
 import numpy as np
 from typing import Optional
 import logging
+import logging.handlers
 
 from stt_module import SpeechToText
 from translation_module import EnglishToRussianTranslator
@@ -39,34 +40,46 @@ class SpeechTranslationPipeline:
         # Text-to-Speech
         self.tts = RussianTextToSpeech(callback=self._on_text_to_speech)
         
-        # Audio player
-        self.audio_player = AudioPlayer()
+        # Audio player, clocked to whatever rate the TTS backend produces
+        # (24 kHz for Silero, 22.05 kHz for gTTS)
+        self.audio_player = AudioPlayer(sample_rate=self.tts.sample_rate)
         
         # Pipeline state
         self.is_running = False
         self.request_counter = 0
         self.last_text = ""  # for simple STT debouncing
         
-        # Queues for managing pipeline flow
-        self.stt_queue = queue.Queue()
-        self.translation_queue = queue.Queue()
-        self.tts_queue = queue.Queue()
+        # Deques for managing pipeline flow: append/clear are atomic, and
+        # these are only reported on (get_status) and flushed on shutdown,
+        # so the Queue lock + condition variable bought nothing
+        self.stt_queue = collections.deque()
+        self.translation_queue = collections.deque()
+        self.tts_queue = collections.deque()
         
         self.logger.info("Pipeline initialized successfully")
     
     def _setup_logging(self):
         """Setup logging configuration"""
         if self.enable_logging:
+            # Buffer file output through a MemoryHandler so the hot
+            # callbacks don't pay a disk write per log record; errors and
+            # shutdown (see stop()) flush the buffer
+            self._log_buffer = logging.handlers.MemoryHandler(
+                capacity=100,
+                flushLevel=logging.ERROR,
+                target=logging.FileHandler('speech_translation.log')
+            )
             logging.basicConfig(
                 level=logging.INFO,
                 format='%(asctime)s - %(levelname)s - %(message)s',
                 handlers=[
                     logging.StreamHandler(),
-                    logging.FileHandler('speech_translation.log')
+                    self._log_buffer
                 ]
             )
             self.logger = logging.getLogger(__name__)
         else:
+            self._log_buffer = None
             self.logger = logging.getLogger(__name__)
             self.logger.disabled = True
     
@@ -97,7 +110,7 @@ class SpeechTranslationPipeline:
         print(f"[STT] {request_id} -> EN: {cleaned}")
         
         # Queue for translation
-        self.translation_queue.put((cleaned, request_id))
+        self.translation_queue.append((cleaned, request_id))
         
         # Start translation
         self.translator.translate_async(text, request_id)
@@ -112,7 +125,7 @@ class SpeechTranslationPipeline:
         print(f"[TRANSLATION] {request_id} -> RU: {translated_text}")
         
         # Queue for TTS
-        self.tts_queue.put((translated_text, request_id))
+        self.tts_queue.append((translated_text, request_id))
         
         # Start TTS
         self.tts.synthesize_async(translated_text, request_id)
@@ -164,36 +177,26 @@ class SpeechTranslationPipeline:
         
         # Clear queues
         self._clear_queues()
-        
+
         self.logger.info("Pipeline stopped")
+
+        # Push any buffered log records to disk
+        if self._log_buffer is not None:
+            self._log_buffer.flush()
     
     def _clear_queues(self):
         """Clear all queues"""
-        while not self.stt_queue.empty():
-            try:
-                self.stt_queue.get_nowait()
-            except queue.Empty:
-                break
-        
-        while not self.translation_queue.empty():
-            try:
-                self.translation_queue.get_nowait()
-            except queue.Empty:
-                break
-        
-        while not self.tts_queue.empty():
-            try:
-                self.tts_queue.get_nowait()
-            except queue.Empty:
-                break
+        self.stt_queue.clear()
+        self.translation_queue.clear()
+        self.tts_queue.clear()
     
     def get_status(self) -> dict:
         """Get current pipeline status"""
         return {
             "is_running": self.is_running,
-            "stt_queue_size": self.stt_queue.qsize(),
-            "translation_queue_size": self.translation_queue.qsize(),
-            "tts_queue_size": self.tts_queue.qsize(),
+            "stt_queue_size": len(self.stt_queue),
+            "translation_queue_size": len(self.translation_queue),
+            "tts_queue_size": len(self.tts_queue),
             "total_requests": self.request_counter
         }
     
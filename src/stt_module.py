@@ -4,15 +4,32 @@ Converts English speech to text using microphone input
 """
 
 
-import whisper
+import os
 import torch
 import numpy as np
 import sounddevice as sd
 import threading
-import queue
 import time
 from typing import Optional, Callable
 
+# Prefer the CTranslate2-based faster-whisper backend when available: same
+# Whisper weights, int8/int8_float16 quantized inference, 2-4x lower latency.
+# Fall back to the reference whisper package if faster-whisper is not installed.
+try:
+    from faster_whisper import WhisperModel as _FasterWhisperModel
+except ImportError:
+    _FasterWhisperModel = None
+
+import whisper
+from whisper.audio import log_mel_spectrogram, pad_or_trim
+
+# WebRTC VAD for end-of-utterance detection; the energy gate below is the
+# fallback when it is not installed
+try:
+    import webrtcvad
+except ImportError:
+    webrtcvad = None
+
 
 class SpeechToText:
     def __init__(self, model_size: str = "base", callback: Optional[Callable] = None):
@@ -26,7 +43,9 @@ class SpeechToText:
         self.model_size = model_size
         self.callback = callback
         self.model = None
-        self.audio_queue = queue.Queue()
+        # Backend selection: "faster-whisper" (default when installed),
+        # "onnx" (ONNX Runtime via optimum) or "whisper" (reference package)
+        self.backend = os.getenv("STS_STT_BACKEND", "faster-whisper" if _FasterWhisperModel else "whisper")
         self.is_recording = False
         self.recording_thread = None
         self.processing_thread = None
@@ -34,63 +53,275 @@ class SpeechToText:
         # Audio settings
         self.CHANNELS = 1
         self.RATE = 16000  # Whisper expects 16kHz
-        # Shorter chunk so we get continuous updates while you speak
-        self.CHUNK_DURATION = 2  # seconds
-        self.CHUNK_SIZE = int(self.RATE * self.CHUNK_DURATION)
+        # Upper bound on a single utterance; transcription normally fires
+        # earlier, on VAD end-of-utterance (see _process_audio)
+        self.MAX_UTTERANCE_DURATION = 4  # seconds
+        self.MAX_UTTERANCE_SIZE = int(self.RATE * self.MAX_UTTERANCE_DURATION)
+
+        # Preallocated accumulation buffer for _process_audio: appending
+        # into a fixed float32 array keeps memory traffic linear, where the
+        # old per-chunk np.concatenate re-copied the whole growing buffer.
+        self._buf = np.empty(self.MAX_UTTERANCE_SIZE, dtype=np.float32)
+        self._write = 0
+
+        # VAD endpointing state: scan accumulated audio in 30ms frames and
+        # transcribe as soon as speech is followed by >300ms of silence,
+        # instead of always waiting for a fixed-length chunk
+        self._vad = webrtcvad.Vad(3) if webrtcvad is not None else None
+        self._VAD_FRAME = int(self.RATE * 0.03)  # 30ms, webrtcvad frame size
+        self._END_SILENCE_FRAMES = 10  # 300ms of trailing silence ends the utterance
+        self._vad_pos = 0
+        self._in_speech = False
+        self._silence_frames = 0
+
+        # Bounded SPSC ring between the audio callback (producer) and the
+        # processing thread (consumer). With exactly one writer per index,
+        # the plain int head/tail are safe without a lock, the callback
+        # never blocks or allocates, and a full ring drops the new block
+        # instead of growing without bound while Whisper stalls.
+        self._BLOCK_FRAMES = 256  # matches the InputStream blocksize
+        self._RING_BLOCKS = 64    # ~1s of audio at 16ms per block
+        self._ring = np.empty((self._RING_BLOCKS, self._BLOCK_FRAMES), dtype=np.float32)
+        self._ring_frames = np.zeros(self._RING_BLOCKS, dtype=np.int32)
+        self._ring_head = 0  # consumer index, written only by _process_audio
+        self._ring_tail = 0  # producer index, written only by _audio_callback
+        self._dropped_blocks = 0
+        self._dropped_reported = 0
+
+        # Per-sample mean-square threshold for the noise gate (~0.02 RMS).
+        # Comparing against sum-of-squares runs as a single BLAS dot pass
+        # instead of the two passes (abs + max) with a temp array.
+        self._energy_thresh_sq = 0.02 ** 2
         
         # Load model
         self._load_model()
     
     def _load_model(self):
         """Load Whisper model"""
-        print(f"Loading Whisper model: {self.model_size}")
-        self.model = whisper.load_model(self.model_size)
+        if self.backend == "faster-whisper" and _FasterWhisperModel is not None:
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+            # int8_float16 on GPU, plain int8 on CPU; overridable per deployment
+            default_compute = "int8_float16" if device == "cuda" else "int8"
+            compute_type = os.getenv("STS_STT_COMPUTE_TYPE", default_compute)
+            print(f"Loading faster-whisper model: {self.model_size} ({device}, {compute_type})")
+            self.model = _FasterWhisperModel(
+                self.model_size,
+                device=device,
+                compute_type=compute_type,
+                cpu_threads=os.cpu_count() or 1,
+            )
+        elif self.backend == "onnx":
+            # ONNX Runtime with full graph optimization (op fusion, constant
+            # folding); export once with:
+            #   optimum-cli export onnx --model openai/whisper-<size> \
+            #       --task automatic-speech-recognition models/whisper-<size>-onnx
+            try:
+                from optimum.onnxruntime import ORTModelForSpeechSeq2Seq
+                from transformers import WhisperProcessor
+
+                model_dir = os.getenv(
+                    "STS_STT_ONNX_DIR", f"models/whisper-{self.model_size}-onnx"
+                )
+                source = model_dir if os.path.isdir(model_dir) else f"openai/whisper-{self.model_size}"
+                provider = (
+                    "CUDAExecutionProvider" if torch.cuda.is_available()
+                    else "CPUExecutionProvider"
+                )
+                print(f"Loading ONNX Whisper model: {source} ({provider})")
+                self._onnx_processor = WhisperProcessor.from_pretrained(source)
+                self.model = ORTModelForSpeechSeq2Seq.from_pretrained(
+                    source, export=not os.path.isdir(model_dir), provider=provider
+                )
+            except Exception as e:
+                print(f"ONNX backend unavailable ({e}); falling back to whisper")
+                self.backend = "whisper"
+        if self.model is None:
+            self.backend = "whisper"
+            print(f"Loading Whisper model: {self.model_size}")
+            self.model = whisper.load_model(self.model_size)
+            self._device = next(self.model.parameters()).device
+            # FP16 halves the encoder's memory bandwidth on GPU
+            self._fp16 = self._device.type == "cuda"
+            self._decode_options = whisper.DecodingOptions(
+                language="en", fp16=self._fp16, without_timestamps=True
+            )
+            # Every chunk is padded to 30s (1x80x3000 mel), so the encoder
+            # only ever sees one shape: trace it so the JIT can fold the
+            # positional embeddings and fuse the fixed kernel sequence.
+            # Opt out with STS_STT_JIT=0.
+            if os.getenv("STS_STT_JIT", "1") != "0":
+                try:
+                    example = torch.zeros(
+                        1, self.model.dims.n_mels, 3000,
+                        device=self._device,
+                        dtype=torch.float16 if self._fp16 else torch.float32,
+                    )
+                    self.model.encoder = torch.jit.trace(self.model.encoder, example)
+                except Exception as e:
+                    print(f"Encoder JIT trace failed ({e}); using eager encoder")
         print("Whisper model loaded successfully")
+
+    def _transcribe(self, audio) -> str:
+        """Run the loaded backend on audio data or a file path and return text."""
+        if self.backend == "faster-whisper":
+            segments, _ = self.model.transcribe(
+                audio,
+                language="en",
+                beam_size=1,
+                vad_filter=True,
+                condition_on_previous_text=False,
+            )
+            return " ".join(segment.text for segment in segments).strip()
+
+        if self.backend == "onnx":
+            if not isinstance(audio, np.ndarray):
+                audio = whisper.load_audio(audio)
+            inputs = self._onnx_processor(audio, sampling_rate=self.RATE, return_tensors="pt")
+            generated = self.model.generate(inputs.input_features)
+            return self._onnx_processor.batch_decode(generated, skip_special_tokens=True)[0].strip()
+
+        if isinstance(audio, np.ndarray):
+            return self._transcribe_whisper_array(audio)
+
+        result = self.model.transcribe(audio, language="en")
+        return result["text"].strip()
+
+    def _transcribe_whisper_array(self, audio_data: np.ndarray) -> str:
+        """Decode an audio chunk via precomputed mel features (whisper backend).
+
+        The log-mel spectrogram is computed directly on the model's device
+        (FP16 on GPU, with a pinned non-blocking host->device copy) and fed
+        to whisper.decode, skipping transcribe()'s segmentation and
+        temperature-fallback loop, which is overkill for short chunks.
+        """
+        audio_t = torch.from_numpy(np.ascontiguousarray(audio_data))
+        if self._device.type == "cuda":
+            audio_t = audio_t.pin_memory().to(self._device, non_blocking=True)
+        # The mel filterbank is cached inside whisper.audio after the first
+        # call, so this is a single STFT + matmul on the model's device
+        mel = log_mel_spectrogram(pad_or_trim(audio_t))
+        if self._fp16:
+            mel = mel.half()
+        result = whisper.decode(self.model, mel, self._decode_options)
+        return result.text.strip()
     
     def _audio_callback(self, indata, frames, time, status):
-        """Callback for audio stream"""
+        """Callback for audio stream: copy the block into the SPSC ring.
+
+        This is the only work allowed here: one bounded copy out of the
+        PortAudio-owned indata (which is reused across callbacks) into a
+        persistent ring slot. No allocation, no locks, no blocking.
+        """
         if self.is_recording:
-            self.audio_queue.put(indata.copy())
+            tail = self._ring_tail
+            if tail - self._ring_head >= self._RING_BLOCKS:
+                # Ring full: drop rather than block — the PortAudio callback
+                # must never wait, and the consumer will catch up
+                self._dropped_blocks += 1
+                return None
+            slot = tail % self._RING_BLOCKS
+            frames = min(frames, self._BLOCK_FRAMES)
+            np.copyto(self._ring[slot, :frames], indata[:frames, 0])
+            self._ring_frames[slot] = frames
+            # Publish only after the samples are in place
+            self._ring_tail = tail + 1
         # sounddevice expects this callback to either modify in/out buffers
         # and return None. We only enqueue data for background processing.
         return None
     
-    def _process_audio(self):
-        """Process audio chunks in background"""
-        # Use float32 consistently to match sounddevice output and Whisper expectations
-        audio_buffer = np.array([], dtype=np.float32)
+    def _frame_has_speech(self, frame: np.ndarray) -> bool:
+        """Classify one 30ms frame as speech or silence"""
+        if self._vad is not None:
+            pcm16 = (frame * 32767.0).astype(np.int16)
+            return self._vad.is_speech(pcm16.tobytes(), self.RATE)
+        # Energy fallback: one fused dot-product pass, no temp arrays
+        return float(frame @ frame) >= self._energy_thresh_sq * frame.size
 
-        while self.is_recording or not self.audio_queue.empty():
-            try:
-                # Get audio chunk
-                chunk = self.audio_queue.get(timeout=0.1)
+    def _flush_utterance(self):
+        """Transcribe the accumulated utterance and reset endpointing state"""
+        # Copy so the buffer can keep filling during transcription
+        audio_data = self._buf[:self._write].copy()
+        self._write = 0
+        self._vad_pos = 0
+        self._in_speech = False
+        self._silence_frames = 0
 
-                # Ensure chunk is float32 and flattened
-                chunk = np.asarray(chunk, dtype=np.float32).flatten()
+        text = self._transcribe(audio_data)
+        if text and self.callback:
+            self.callback(text)
 
-                # Skip very low-energy chunks (likely background noise or feedback)
-                if np.max(np.abs(chunk)) < 0.02:
+    @staticmethod
+    def _raise_thread_priority():
+        """Best-effort priority boost for the audio processing thread.
+
+        Keeps callback->VAD handoff jitter low under load; silently a no-op
+        where the OS (or missing privileges) doesn't allow it.
+        """
+        try:
+            if os.name == "nt":
+                import ctypes
+                kernel32 = ctypes.windll.kernel32
+                # THREAD_PRIORITY_TIME_CRITICAL = 15
+                kernel32.SetThreadPriority(kernel32.GetCurrentThread(), 15)
+            else:
+                os.sched_setscheduler(
+                    0, os.SCHED_FIFO, os.sched_param(os.sched_get_priority_min(os.SCHED_FIFO))
+                )
+        except (AttributeError, OSError, PermissionError):
+            pass
+
+    def _process_audio(self):
+        """Process audio blocks in background with VAD endpointing"""
+        self._raise_thread_priority()
+        self._write = 0
+        self._vad_pos = 0
+        self._in_speech = False
+        self._silence_frames = 0
+
+        while self.is_recording or self._ring_head != self._ring_tail:
+            try:
+                if self._ring_head == self._ring_tail:
+                    if self._dropped_blocks != self._dropped_reported:
+                        print(f"Audio overrun: dropped {self._dropped_blocks - self._dropped_reported} blocks")
+                        self._dropped_reported = self._dropped_blocks
+                    time.sleep(0.004)  # ~1/4 block; the ring is lock-free, so poll
                     continue
 
-                audio_buffer = np.concatenate([audio_buffer, chunk])
+                # Read the next block straight out of the ring slot
+                slot = self._ring_head % self._RING_BLOCKS
+                chunk = self._ring[slot, :int(self._ring_frames[slot])]
 
-                # Process when we have enough data
-                if len(audio_buffer) >= self.CHUNK_SIZE:
-                    # Take the chunk
-                    audio_data = audio_buffer[:self.CHUNK_SIZE].astype(np.float32)
+                # Append into the preallocated buffer (drop overflow rather
+                # than reallocating; the buffer holds one max-length utterance)
+                n = min(chunk.size, self._buf.size - self._write)
+                self._buf[self._write:self._write + n] = chunk[:n]
+                self._write += n
 
-                    # Transcribe
-                    result = self.model.transcribe(audio_data, language="en")
-                    text = result["text"].strip()
+                # Samples are copied out; free the slot before the
+                # (potentially slow) transcription below
+                self._ring_head += 1
 
-                    if text and self.callback:
-                        self.callback(text)
+                # Run VAD over any newly completed 30ms frames
+                while self._write - self._vad_pos >= self._VAD_FRAME:
+                    frame = self._buf[self._vad_pos:self._vad_pos + self._VAD_FRAME]
+                    self._vad_pos += self._VAD_FRAME
+                    if self._frame_has_speech(frame):
+                        self._in_speech = True
+                        self._silence_frames = 0
+                    elif self._in_speech:
+                        self._silence_frames += 1
 
-                    # Remove processed data
-                    audio_buffer = audio_buffer[self.CHUNK_SIZE:]
+                if not self._in_speech:
+                    # Nothing but silence so far: discard and start over so
+                    # Whisper never runs on empty audio
+                    self._write = 0
+                    self._vad_pos = 0
+                elif (self._silence_frames >= self._END_SILENCE_FRAMES
+                        or self._write >= self.MAX_UTTERANCE_SIZE):
+                    # End of utterance (or buffer full): transcribe now, so
+                    # short utterances don't wait out a fixed-length chunk
+                    self._flush_utterance()
 
-            except queue.Empty:
-                continue
             except Exception as e:
                 print(f"Error processing audio: {e}")
     
@@ -106,12 +337,16 @@ class SpeechToText:
         self.processing_thread.daemon = True
         self.processing_thread.start()
         
-        # Start audio stream
+        # Start audio stream: 256-sample blocks (16ms) with the low-latency
+        # host buffer so capture->STT handoff stays under ~10ms instead of
+        # the 64ms a 1024 blocksize imposed
         self.stream = sd.InputStream(
             samplerate=self.RATE,
             channels=self.CHANNELS,
+            dtype='float32',
             callback=self._audio_callback,
-            blocksize=1024
+            blocksize=self._BLOCK_FRAMES,
+            latency='low'
         )
         self.stream.start()
         
@@ -133,13 +368,11 @@ class SpeechToText:
     
     def transcribe_file(self, audio_path: str) -> str:
         """Transcribe audio file"""
-        result = self.model.transcribe(audio_path, language="en")
-        return result["text"].strip()
-    
+        return self._transcribe(audio_path)
+
     def transcribe_audio_data(self, audio_data: np.ndarray) -> str:
         """Transcribe audio data directly"""
-        result = self.model.transcribe(audio_data, language="en")
-        return result["text"].strip()
+        return self._transcribe(audio_data)
 
 
 if __name__ == "__main__":
@@ -3,13 +3,29 @@ Translation Module using MarianMT (Helsinki-NLP)
 Translates English text to Russian
 """
 
+import os
 import torch
 from transformers import MarianMTModel, MarianTokenizer
 import threading
 import queue
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Callable
 
+# Optional CTranslate2 backend: int8-quantized Marian runtime, 2-5x faster
+# than HF transformers for these small encoder-decoders. Requires a one-time
+# conversion, e.g.:
+#   ct2-transformers-converter --model Helsinki-NLP/opus-mt-en-ru \
+#       --quantization int8 --output_dir models/opus-en-ru-ct2
+try:
+    import ctranslate2
+except ImportError:
+    ctranslate2 = None
+
+# Directory holding the converted CTranslate2 model (see above)
+CT2_MODEL_DIR = os.getenv("STS_CT2_MODEL_DIR", "models/opus-en-ru-ct2")
+
 
 class EnglishToRussianTranslator:
     def __init__(self, callback: Optional[Callable] = None):
@@ -22,10 +38,18 @@ class EnglishToRussianTranslator:
         self.callback = callback
         self.model = None
         self.tokenizer = None
+        self.ct2_translator = None
+        self._autocast_bf16 = False
+        # LRU cache of recent translations: live captioning repeats short
+        # phrases constantly, and a hit skips the whole model call
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.CACHE_SIZE = 512
+        # Async requests queue through translation_queue and are drained in
+        # batches by jobs on a single shared worker (see translate_async)
         self.translation_queue = queue.Queue()
-        self.is_translating = False
-        self.translation_thread = None
-        
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mt")
+
         # Load model
         self._load_model()
     
@@ -33,40 +57,123 @@ class EnglishToRussianTranslator:
         """Load MarianMT model for English to Russian"""
         model_name = "Helsinki-NLP/opus-mt-en-ru"
         print(f"Loading translation model: {model_name}")
-        
+
+        # The HF tokenizer handles subword encode/decode for both backends
         self.tokenizer = MarianTokenizer.from_pretrained(model_name)
-        self.model = MarianMTModel.from_pretrained(model_name)
-        
+
+        if ctranslate2 is not None and not os.path.isdir(CT2_MODEL_DIR):
+            # One-time int8 conversion (same as running
+            # ct2-transformers-converter by hand); failures just fall back
+            try:
+                from ctranslate2.converters import TransformersConverter
+
+                print(f"Converting {model_name} to CTranslate2 int8: {CT2_MODEL_DIR}")
+                TransformersConverter(model_name).convert(CT2_MODEL_DIR, quantization="int8")
+            except Exception as e:
+                print(f"CTranslate2 conversion failed ({e}); using transformers backend")
+
+        if ctranslate2 is not None and os.path.isdir(CT2_MODEL_DIR):
+            print(f"Using CTranslate2 int8 backend: {CT2_MODEL_DIR}")
+            self.ct2_translator = ctranslate2.Translator(
+                CT2_MODEL_DIR,
+                compute_type="int8",
+                inter_threads=1,
+                intra_threads=os.cpu_count(),
+            )
+        elif os.getenv("STS_MT_BACKEND") == "onnx":
+            # ONNX Runtime backend (op fusion + constant folding via ORT's
+            # graph optimizer); export once with:
+            #   optimum-cli export onnx --model Helsinki-NLP/opus-mt-en-ru \
+            #       models/opus-en-ru-onnx
+            # The ORT model is generate()-compatible, so translate() is
+            # unchanged.
+            try:
+                from optimum.onnxruntime import ORTModelForSeq2SeqLM
+
+                model_dir = os.getenv("STS_MT_ONNX_DIR", "models/opus-en-ru-onnx")
+                source = model_dir if os.path.isdir(model_dir) else model_name
+                provider = (
+                    "CUDAExecutionProvider" if torch.cuda.is_available()
+                    else "CPUExecutionProvider"
+                )
+                print(f"Using ONNX Runtime backend: {source} ({provider})")
+                self.model = ORTModelForSeq2SeqLM.from_pretrained(
+                    source, export=not os.path.isdir(model_dir), provider=provider
+                )
+            except Exception as e:
+                print(f"ONNX backend unavailable ({e}); falling back to transformers")
+                self.model = MarianMTModel.from_pretrained(model_name)
+        else:
+            self.model = MarianMTModel.from_pretrained(model_name)
+
+        if self.model is not None and isinstance(self.model, MarianMTModel):
+            self.model.eval()
+            # bf16 halves tensor bandwidth and torch.compile fuses the
+            # attention/GEMM kernels; opt out with STS_MT_COMPILE=0 on
+            # CPUs where bf16 emulation is slower than fp32
+            if os.getenv("STS_MT_COMPILE", "1") != "0":
+                try:
+                    self.model = self.model.to(torch.bfloat16)
+                    self._autocast_bf16 = True
+                    self.model = torch.compile(
+                        self.model, mode="reduce-overhead", fullgraph=False
+                    )
+                    # Warmup generate so Inductor compiles at load time
+                    # instead of on the first live translation
+                    warm = self.tokenizer("Hello.", return_tensors="pt")
+                    with torch.inference_mode(), torch.autocast("cpu", dtype=torch.bfloat16):
+                        self.model.generate(**warm, max_length=8, num_beams=1)
+                except Exception as e:
+                    print(f"torch.compile/bf16 unavailable ({e}); staying in eager fp32")
+                    self.model = MarianMTModel.from_pretrained(model_name).eval()
+                    self._autocast_bf16 = False
+
         print("Translation model loaded successfully")
     
-    def _process_translations(self):
-        """Process translation requests in background"""
-        while self.is_translating or not self.translation_queue.empty():
+    MAX_BATCH = 8
+
+    def _drain_and_translate(self):
+        """Run one batch of queued requests on the worker thread.
+
+        Drains any backlog so it runs as one padded batch: the per-step
+        decoder matmuls amortize across the batch dimension. With a
+        single worker, queued submissions serialize, so each job either
+        finds work or returns immediately (its texts were drained by an
+        earlier job's batch).
+        """
+        texts, ids = [], []
+        while len(texts) < self.MAX_BATCH:
             try:
-                # Get translation request
-                text, request_id = self.translation_queue.get(timeout=0.1)
-                
-                # Translate
-                translated_text = self.translate(text)
-                
-                # Call callback if provided
-                if self.callback:
-                    self.callback(translated_text, request_id)
-                    
+                text, request_id = self.translation_queue.get_nowait()
             except queue.Empty:
-                continue
-            except Exception as e:
-                print(f"Error in translation: {e}")
-    
+                break
+            texts.append(text)
+            ids.append(request_id)
+
+        if not texts:
+            return
+
+        try:
+            translations = self.translate_batch(texts)
+
+            # Call callback if provided
+            if self.callback:
+                for translated_text, batch_request_id in zip(translations, ids):
+                    self.callback(translated_text, batch_request_id)
+
+        except Exception as e:
+            print(f"Error in translation: {e}")
+
     def translate_async(self, text: str, request_id: str = None):
         """Translate text asynchronously"""
-        if not self.is_translating:
-            self.is_translating = True
-            self.translation_thread = threading.Thread(target=self._process_translations)
-            self.translation_thread.daemon = True
-            self.translation_thread.start()
-        
         self.translation_queue.put((text, request_id))
+        try:
+            self._executor.submit(self._drain_and_translate)
+        except RuntimeError:
+            # stop_translation shut the executor down; recreate it so a
+            # stopped pipeline can be started again
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mt")
+            self._executor.submit(self._drain_and_translate)
     
     def translate(self, text: str) -> str:
         """
@@ -78,49 +185,106 @@ class EnglishToRussianTranslator:
         Returns:
             Russian translation
         """
-        if not text.strip():
+        text = text.strip()
+        if not text:
             return ""
-        
+
+        # Cache lookup first (keyed on the stripped text, not lowercased:
+        # casing changes MarianMT's output, so it must stay in the key)
+        with self._cache_lock:
+            cached = self._cache.get(text)
+            if cached is not None:
+                self._cache.move_to_end(text)
+                return cached
+
+        translated_text = self._translate_uncached(text)
+
+        with self._cache_lock:
+            self._cache[text] = translated_text
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return translated_text
+
+    def _translate_uncached(self, text: str) -> str:
+        """Run the model on text, bypassing the LRU cache"""
+        if self.ct2_translator is not None:
+            # Quantized int8 path: feed subword tokens straight to CTranslate2
+            tokens = self.tokenizer.convert_ids_to_tokens(self.tokenizer.encode(text))
+            results = self.ct2_translator.translate_batch(
+                [tokens], beam_size=1, max_decoding_length=256
+            )
+            output_ids = self.tokenizer.convert_tokens_to_ids(results[0].hypotheses[0])
+            return self.tokenizer.decode(output_ids, skip_special_tokens=True).strip()
+
         # Tokenize input
         inputs = self.tokenizer(text, return_tensors="pt", padding=True, truncation=True)
-        
-        # Generate translation
-        with torch.no_grad():
-            translated = self.model.generate(**inputs, max_length=512, num_beams=4, 
-                                           early_stopping=True, temperature=0.7)
-        
+
+        # Generate translation (no temperature: it is silently ignored with
+        # beam search and only triggers a transformers warning path)
+        with torch.inference_mode(), torch.autocast("cpu", dtype=torch.bfloat16,
+                                                    enabled=self._autocast_bf16):
+            translated = self.model.generate(**inputs, max_length=256, num_beams=1,
+                                           do_sample=False)
+
         # Decode and return
         translated_text = self.tokenizer.decode(translated[0], skip_special_tokens=True)
         return translated_text.strip()
     
     def translate_batch(self, texts: list) -> list:
-        """Translate multiple texts at once"""
-        translations = []
-        for text in texts:
-            translation = self.translate(text)
-            translations.append(translation)
-        return translations
+        """Translate multiple texts in a single batched model call"""
+        if not texts:
+            return []
+
+        if self.ct2_translator is not None:
+            token_lists = [
+                self.tokenizer.convert_ids_to_tokens(self.tokenizer.encode(text))
+                for text in texts
+            ]
+            results = self.ct2_translator.translate_batch(
+                token_lists, beam_size=1, max_decoding_length=256
+            )
+            return [
+                self.tokenizer.decode(
+                    self.tokenizer.convert_tokens_to_ids(result.hypotheses[0]),
+                    skip_special_tokens=True,
+                ).strip()
+                for result in results
+            ]
+
+        inputs = self.tokenizer(texts, return_tensors="pt", padding=True, truncation=True)
+        with torch.inference_mode(), torch.autocast("cpu", dtype=torch.bfloat16,
+                                                    enabled=self._autocast_bf16):
+            translated = self.model.generate(**inputs, max_length=256, num_beams=1,
+                                           do_sample=False)
+        return [
+            text.strip()
+            for text in self.tokenizer.batch_decode(translated, skip_special_tokens=True)
+        ]
     
     def stop_translation(self):
         """Stop translation processing"""
-        self.is_translating = False
-        if self.translation_thread:
-            self.translation_thread.join(timeout=1.0)
+        self._executor.shutdown(wait=False)
+
+
+# Hoisted to module scope so is_english doesn't rebuild the word list per
+# call; frozenset membership is O(1) versus the old linear list scan
+_EN_WORDS = frozenset({
+    'the', 'and', 'is', 'to', 'a', 'in', 'that', 'have', 'i',
+    'it', 'for', 'not', 'on', 'with', 'he', 'as', 'you', 'do', 'at',
+})
 
 
 class LanguageDetector:
     """Simple language detection for validation"""
-    
+
     @staticmethod
     def is_english(text: str) -> bool:
         """Simple check if text is likely English"""
-        english_words = ['the', 'and', 'is', 'to', 'a', 'in', 'that', 'have', 'i', 
-                        'it', 'for', 'not', 'on', 'with', 'he', 'as', 'you', 'do', 'at']
         words = text.lower().split()
         if not words:
             return False
-        
-        english_count = sum(1 for word in words if word in english_words)
+
+        english_count = sum(1 for word in words if word in _EN_WORDS)
         return english_count / len(words) > 0.3  # At least 30% common English words
 
 
@@ -5,20 +5,67 @@ Converts Russian text to audio
 
 import numpy as np
 import soundfile as sf
+import sounddevice as sd
 import threading
 import queue
+import re
 import time
 import io
-import tempfile
 import os
 import subprocess
-from typing import Optional, Callable
+import base64
+import functools
+import hashlib
+import urllib.request
+import requests
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional, Callable
 from gtts import gTTS
-
-# Optional pygame import – only import/initialize if not in server mode
+from gtts.tts import gTTSError
+
+# Optional in-process MP3 decoding: avoids the ffmpeg subprocess +
+# temp-file round-trip per synthesis. miniaudio is preferred - one C call
+# does decode, downmix, and resample on a single buffer - with PyAV
+# (which bundles FFmpeg's libraries) as the next choice.
+try:
+    import miniaudio
+except ImportError:
+    miniaudio = None
+try:
+    import av
+except ImportError:
+    av = None
+
+# Optional pygame playback – disabled entirely in server mode
 _PYGAME_ENABLED = os.getenv("STS_DISABLE_PYGAME", "0") != "1"
-if _PYGAME_ENABLED:
-    import pygame
+
+# Loaded lazily: importing pygame costs hundreds of ms and ~20MB of SDL
+# state, which processes that only synthesize (to file or over the API)
+# never need. See _pg().
+_pygame = None
+_pygame_lock = threading.Lock()
+
+
+def _pg(sample_rate: int = 22050):
+    """Import pygame and initialize its mixer on first playback use.
+
+    Re-initializes the mixer if it is already running at a different
+    frequency: Sound(buffer=...) plays raw PCM at the mixer's rate, so a
+    stale rate shifts the pitch of everything played afterwards.
+    """
+    global _pygame
+    with _pygame_lock:
+        if _pygame is None:
+            import pygame
+            pygame.mixer.init(frequency=sample_rate, size=-16, channels=1, buffer=512)
+            _pygame = pygame
+        else:
+            mixer_init = _pygame.mixer.get_init()
+            if mixer_init is not None and mixer_init[0] != sample_rate:
+                _pygame.mixer.quit()
+                _pygame.mixer.init(frequency=sample_rate, size=-16, channels=1, buffer=512)
+        return _pygame
 
 
 """Configure ffmpeg binary path.
@@ -44,109 +91,475 @@ else:
         os.environ["FFMPEG_BINARY"] = system_ffmpeg
 
 
+@functools.lru_cache(maxsize=None)
+def _resolve_ffmpeg() -> str:
+    """Resolve the ffmpeg binary once per process.
+
+    All instances share the one detection result (env override, local
+    bundle, PATH) so nothing downstream ever re-stats the filesystem.
+    Missing ffmpeg is only a warning: the in-process decoders make the
+    subprocess fallback optional.
+    """
+    path = os.environ.get("FFMPEG_BINARY")
+    if path:
+        return path
+    path = shutil.which("ffmpeg")
+    if path:
+        return path
+    print("ffmpeg not found (bundle, FFMPEG_BINARY, PATH); pipe fallback unavailable")
+    return "ffmpeg"
+
+
+class _KeepAliveGTTS(gTTS):
+    """gTTS variant that reuses one keep-alive HTTPS session.
+
+    Stock gTTS opens and closes a fresh requests.Session per call, so
+    every synthesis pays a full TLS handshake - which dominates latency
+    for short utterances. Sending the same prepared requests through a
+    shared pooled session amortizes the handshake across calls. A
+    transport failure on the pooled session retries once through the
+    stock per-call implementation; response format drift raises like
+    upstream does, so it can't silently double the round-trips.
+    """
+
+    _session = requests.Session()
+    _session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=16))
+
+    def stream(self):
+        chunks = []
+        try:
+            for pr in self._prepare_requests():
+                r = self._session.send(
+                    request=pr, proxies=urllib.request.getproxies(), verify=False
+                )
+                r.raise_for_status()
+                # Same batchexecute payload parsing as upstream gTTS
+                for line in r.iter_lines(chunk_size=1024):
+                    decoded = line.decode("utf-8")
+                    if "jQ1olc" in decoded:
+                        match = re.search(r'jQ1olc","\[\\"(.*)\\"', decoded)
+                        if match:
+                            chunks.append(base64.b64decode(match.group(1)))
+                        else:
+                            raise gTTSError(tts=self)
+        except requests.RequestException:
+            # Transport failure only: the endpoint may dislike the pooled
+            # session, so retry through the stock per-call one
+            yield from super().stream()
+            return
+
+        yield from chunks
+
+
+def _wait_for_channel(channel, duration: float):
+    """Block until a pygame channel finishes, without busy-polling.
+
+    pygame only delivers end-events through a display event pump, which a
+    headless TTS process doesn't run - but the clip length is known
+    exactly, so one sleep covers essentially the whole wait and a short
+    poll at the end absorbs mixer/device drift.
+    """
+    if channel is None:
+        return
+    time.sleep(duration)
+    while channel.get_busy():
+        time.sleep(0.01)
+
+
+class _FfmpegPool:
+    """Pool of pre-spawned ffmpeg processes for the pipe-transcode fallback.
+
+    ffmpeg exits after one stdin->stdout job, so each process is single
+    use; the win is *when* the fork/exec happens. Pre-spawning keeps warm
+    processes waiting on stdin, and each checkout triggers a background
+    respawn, so the (10-50ms, worst on Windows) process-creation cost is
+    paid off the synthesis hot path instead of inside it.
+    """
+
+    def __init__(self, cmd, size: int = 2):
+        self._cmd = list(cmd)
+        self._procs = queue.Queue()
+        for _ in range(size):
+            self._spawn()
+
+    def _spawn(self):
+        try:
+            self._procs.put(subprocess.Popen(
+                self._cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            ))
+        except OSError as e:
+            print(f"ffmpeg spawn failed: {e}")
+
+    def run(self, input_bytes: bytes):
+        """Feed input to a warm process; returns (returncode, stdout, stderr)."""
+        try:
+            proc = self._procs.get_nowait()
+        except queue.Empty:
+            proc = subprocess.Popen(
+                self._cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+        # Respawn concurrently with the transcode below so the next call
+        # finds a warm process waiting
+        threading.Thread(target=self._spawn, daemon=True).start()
+        stdout, stderr = proc.communicate(input_bytes)
+        return proc.returncode, stdout, stderr
+
+
 class RussianTextToSpeech:
     def __init__(self, callback: Optional[Callable] = None):
-        """Initialize TTS pipeline using gTTS and pygame."""
+        """Initialize TTS pipeline using Silero (offline) or gTTS."""
         self.callback = callback
-        self.tts_queue = queue.Queue()
-        self.is_speaking = False
-        self.tts_thread = None
 
         # Audio settings
         self.sample_rate = 22050  # standard TTS sample rate
-        self.temp_dir = tempfile.gettempdir()
 
-        # Initialize pygame mixer for playback (skip in server mode)
-        if _PYGAME_ENABLED:
-            pygame.mixer.init(frequency=self.sample_rate, size=-16, channels=1, buffer=512)
-
-        print("gTTS-based RussianTextToSpeech initialized")
-
-    def _process_tts(self):
-        """Background worker to process queued TTS requests."""
-        while self.is_speaking or not self.tts_queue.empty():
+        # Shared, cached detection result - no per-instance env lookups
+        # or filesystem stats
+        self._ffmpeg_bin = _resolve_ffmpeg()
+
+        # LRU cache of synthesized utterances, bounded by total sample
+        # bytes rather than entry count: a hit turns the whole synthesis
+        # pipeline into a dict lookup, and dialogue repeats short phrases
+        # constantly. Keyed on normalized text + backend + rate.
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_bytes = 0
+        self.CACHE_BUDGET_BYTES = 64 * 1024 * 1024
+
+        # Persistent second tier: int16 PCM files keyed by a blake2b of
+        # the cache key, so repeated phrases survive process restarts.
+        # Disable by setting STS_TTS_CACHE_DIR to an empty string.
+        self._cache_dir = os.getenv("STS_TTS_CACHE_DIR", "tts_cache")
+        self.DISK_BUDGET_BYTES = 500 * 1024 * 1024
+        if self._cache_dir:
+            try:
+                os.makedirs(self._cache_dir, exist_ok=True)
+            except OSError as e:
+                print(f"TTS disk cache unavailable ({e})")
+                self._cache_dir = ""
+
+        # Backend selection: "silero" runs a local neural voice and removes
+        # the per-call HTTPS round-trip to Google; "gtts" keeps the old path.
+        self.backend = os.getenv("STS_TTS_BACKEND", "silero")
+        self._silero_model = None
+        if self.backend == "silero":
             try:
-                text, request_id = self.tts_queue.get(timeout=0.1)
+                import torch
+                self._silero_model, _ = torch.hub.load(
+                    "snakers4/silero-models", "silero_tts",
+                    language="ru", speaker="v4_ru",
+                )
+                self._silero_speaker = os.getenv("STS_SILERO_SPEAKER", "xenia")
+                self.sample_rate = 24000  # Silero v4 native rate
+            except Exception as e:
+                print(f"Silero TTS unavailable ({e}); falling back to gTTS")
+                self.backend = "gtts"
+
+        # Worker pool for synthesize_async: gTTS is network-bound, so
+        # several HTTPS round-trips can overlap; Silero is CPU-bound on
+        # one model, so it stays serialized on a single worker. The
+        # semaphore bounds in-flight work at twice the worker count.
+        self._pool_workers = 1 if self.backend == "silero" else max(4, os.cpu_count() or 1)
+        self._pool = ThreadPoolExecutor(max_workers=self._pool_workers, thread_name_prefix="tts")
+        self._inflight = threading.Semaphore(self._pool_workers * 2)
+
+        # Separate small pool for fanning a long text's sentences out in
+        # parallel (separate so jobs already running on self._pool can't
+        # deadlock waiting on their own sentence futures)
+        self._sentence_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="tts-sent")
+
+        # Dedicated core-bounded pool for the CPU half of gTTS synthesis
+        # (MP3 decode), keeping it off the network-sized fetch workers
+        self._decode_pool = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1, thread_name_prefix="tts-dec"
+        )
+
+        # Warm ffmpeg pool for the gTTS pipe fallback (only needed when
+        # neither in-process decoder is installed)
+        self._ffmpeg_pool = None
+        if self.backend == "gtts" and miniaudio is None and av is None:
+            self._ffmpeg_pool = _FfmpegPool([
+                self._ffmpeg_bin,
+                "-loglevel", "error",
+                "-f", "mp3",  # stdin has no filename to probe from
+                "-i", "pipe:0",
+                "-ar", str(self.sample_rate),
+                "-ac", "1",
+                "-f", "wav",
+                "pipe:1",
+            ])
 
-                audio_data = self.synthesize(text)
+        # pygame (and its mixer) load lazily on first playback - see _pg()
 
-                if self.callback is not None and audio_data is not None and len(audio_data) > 0:
-                    self.callback(audio_data, request_id)
+        print(f"RussianTextToSpeech initialized (backend: {self.backend})")
 
-            except queue.Empty:
-                continue
-            except Exception as e:
-                print(f"Error in TTS worker: {e}")
+    def _synthesize_and_callback(self, text: str, request_id):
+        """Worker-pool job: synthesize and deliver through the callback."""
+        try:
+            audio_data = self.synthesize(text)
 
-        self.is_speaking = False
+            if self.callback is not None and audio_data is not None and len(audio_data) > 0:
+                self.callback(audio_data, request_id)
+        except Exception as e:
+            print(f"Error in TTS worker: {e}")
+        finally:
+            self._inflight.release()
 
     def synthesize_async(self, text: str, request_id: str = None):
-        """Queue text for asynchronous synthesis."""
-        if not self.is_speaking:
-            self.is_speaking = True
-            self.tts_thread = threading.Thread(target=self._process_tts, daemon=True)
-            self.tts_thread.start()
+        """Queue text for asynchronous synthesis on the worker pool.
 
-        self.tts_queue.put((text, request_id))
+        The executor's internal SimpleQueue blocks workers on a condition
+        variable, so an idle pool costs nothing - no 100ms polling wakeups
+        like the old queue.Queue(timeout=0.1) consumer loop.
+        """
+        self._inflight.acquire()  # backpressure once the pool is saturated
+        try:
+            self._pool.submit(self._synthesize_and_callback, text, request_id)
+        except RuntimeError:
+            # stop_tts shut the pool down; recreate it so a stopped
+            # pipeline can be started again
+            try:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self._pool_workers, thread_name_prefix="tts"
+                )
+                self._pool.submit(self._synthesize_and_callback, text, request_id)
+            except Exception:
+                self._inflight.release()
+                raise
 
     def synthesize(self, text: str) -> np.ndarray:
-        """Convert Russian text to audio using gTTS.
+        """Convert Russian text to audio.
 
-        Returns a numpy array of audio samples (mono).
+        Returns a numpy array of audio samples (mono) at ``self.sample_rate``.
+        Cached results are shared, so callers must treat them as read-only.
         """
         if not text or not text.strip():
             return np.array([])
 
-        try:
-            # Temporary file paths
-            temp_mp3 = os.path.join(self.temp_dir, f"tts_{int(time.time()*1000)}.mp3")
-            temp_wav = temp_mp3.replace(".mp3", ".wav")
-
-            # Generate MP3 with gTTS
-            tts = gTTS(text=text, lang="ru")
-            tts.save(temp_mp3)
-
-            # Convert MP3 to WAV using ffmpeg
-            ffmpeg_bin = os.environ.get("FFMPEG_BINARY")
-            if not ffmpeg_bin:
-                # Last resort: try 'ffmpeg' command directly
-                ffmpeg_bin = "ffmpeg"
-            
-            cmd = [
-                ffmpeg_bin,
-                "-y",              # overwrite output
-                "-loglevel", "error",
-                "-i", temp_mp3,
-                "-ar", str(self.sample_rate),
-                "-ac", "1",
-                "-f", "wav",
-                temp_wav,
-            ]
+        key = (" ".join(text.split()), self.backend, self.sample_rate)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
 
-            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            if result.returncode != 0:
-                raise RuntimeError(f"ffmpeg failed: {result.stderr.decode(errors='ignore')}")
+        audio_data = self._disk_cache_get(key)
+        if audio_data is None:
+            audio_data = self._synthesize_uncached(text)
+            if audio_data is not None and len(audio_data) > 0:
+                self._disk_cache_put(key, audio_data)
 
-            # Load WAV into numpy array
-            audio_data, sr = sf.read(temp_wav)
-
-            # Clean up temp files
+        if audio_data is not None and len(audio_data) > 0:
+            with self._cache_lock:
+                self._cache[key] = audio_data
+                self._cache_bytes += audio_data.nbytes
+                while self._cache_bytes > self.CACHE_BUDGET_BYTES:
+                    _, evicted = self._cache.popitem(last=False)
+                    self._cache_bytes -= evicted.nbytes
+        return audio_data
+
+    def _disk_cache_path(self, key) -> str:
+        digest = hashlib.blake2b("|".join(map(str, key)).encode(), digest_size=16).hexdigest()
+        return os.path.join(self._cache_dir, f"{digest}.raw")
+
+    def _disk_cache_get(self, key):
+        """Load a cached utterance from disk, or None on miss."""
+        if not self._cache_dir:
+            return None
+        path = self._disk_cache_path(key)
+        try:
+            pcm = np.fromfile(path, dtype=np.int16)
+            if pcm.size == 0:
+                # Empty or truncated file (e.g. a crash mid-write before
+                # writes were atomic): a miss, not a cached empty utterance
+                os.remove(path)
+                return None
+            os.utime(path)  # touch: mtime is the LRU eviction order
+            return pcm.astype(np.float32) / 32767.0
+        except OSError:
+            return None
+
+    def _disk_cache_put(self, key, audio_data: np.ndarray):
+        """Store an utterance as int16 PCM and sweep past-budget files."""
+        if not self._cache_dir:
+            return
+        try:
+            pcm = np.clip(audio_data * 32767.0, -32768, 32767).astype(np.int16)
+            # Write to a temp file and rename into place so a crash
+            # mid-write never leaves a truncated entry behind
+            path = self._disk_cache_path(key)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            pcm.tofile(tmp_path)
+            os.replace(tmp_path, path)
+
+            # Evict oldest-touched files once the budget is exceeded
+            entries = []
+            total = 0
+            with os.scandir(self._cache_dir) as it:
+                for entry in it:
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+            if total > self.DISK_BUDGET_BYTES:
+                for _, size, path in sorted(entries):
+                    os.remove(path)
+                    total -= size
+                    if total <= self.DISK_BUDGET_BYTES:
+                        break
+        except OSError as e:
+            print(f"TTS disk cache write failed: {e}")
+
+    def _synthesize_uncached(self, text: str) -> np.ndarray:
+        """Run the synthesis backend, bypassing the LRU cache."""
+        if self._silero_model is not None:
             try:
-                os.remove(temp_mp3)
-                os.remove(temp_wav)
-            except OSError:
-                pass
+                audio = self._silero_model.apply_tts(
+                    text=text,
+                    speaker=self._silero_speaker,
+                    sample_rate=self.sample_rate,
+                )
+                return audio.numpy().astype(np.float32, copy=False)
+            except Exception as e:
+                print(f"Error during Silero synthesis: {e}")
+                return np.array([])
+
+        # gTTS latency is ~linear in text length (it requests chunks
+        # serially), so synthesize a multi-sentence passage's sentences
+        # concurrently and stitch them. Each goes through synthesize()
+        # and therefore gets its own cache entry.
+        sentences = [s for s in re.split(r"(?<=[.!?…])\s+", text.strip()) if s.strip()]
+        if len(sentences) > 1:
+            futures = [self._sentence_pool.submit(self.synthesize, s) for s in sentences]
+            pieces = [f.result() for f in futures]
+            pieces = [p for p in pieces if p is not None and len(p) > 0]
+            if not pieces:
+                return np.array([])
+            return self._crossfade_concat(pieces)
 
-            # Ensure mono float32
-            audio_data = np.asarray(audio_data, dtype=np.float32)
-            if audio_data.ndim > 1:
-                audio_data = audio_data.mean(axis=1)
+        try:
+            # The caller blocks on its own decode (synthesize is
+            # synchronous), so this split doesn't overlap fetch with
+            # decode; it bounds concurrent decodes at cpu_count so a
+            # burst of fetch workers finishing together can't
+            # oversubscribe the cores
+            mp3_bytes = self._fetch_mp3(text)
+            return self._decode_pool.submit(self._decode_audio, mp3_bytes).result()
+
+        except Exception as e:
+            print(f"Error during gTTS synthesis: {e}")
+            return np.array([])
+
+    def _fetch_mp3(self, text: str) -> bytes:
+        """Network-bound half: fetch gTTS MP3 bytes over the shared session."""
+        buf = io.BytesIO()
+        _KeepAliveGTTS(text=text, lang="ru").write_to_fp(buf)
+        return buf.getvalue()
 
+    def _decode_audio(self, mp3_bytes: bytes) -> np.ndarray:
+        """CPU-bound half: decode MP3 bytes to mono float32 at self.sample_rate."""
+        try:
+            # Decode in-process when possible: no subprocess spawn, no
+            # temp files, no WAV re-parse
+            if miniaudio is not None:
+                try:
+                    decoded = miniaudio.decode(
+                        mp3_bytes,
+                        output_format=miniaudio.SampleFormat.FLOAT32,
+                        nchannels=1,
+                        sample_rate=self.sample_rate,
+                    )
+                    return np.asarray(decoded.samples, dtype=np.float32)
+                except Exception as e:
+                    print(f"miniaudio decode failed ({e}); trying next decoder")
+            if av is not None:
+                return self._decode_mp3(mp3_bytes)
+
+            # Fallback: pipe the in-memory MP3 through a warm ffmpeg
+            # process from the pool. stdin/stdout pipes mean no temp
+            # files, no os.remove cleanup, and no racy time-based
+            # filenames under concurrency.
+            if self._ffmpeg_pool is None:
+                self._ffmpeg_pool = _FfmpegPool([
+                    self._ffmpeg_bin,
+                    "-loglevel", "error",
+                    "-f", "mp3",  # stdin has no filename to probe from
+                    "-i", "pipe:0",
+                    "-ar", str(self.sample_rate),
+                    "-ac", "1",
+                    "-f", "wav",
+                    "pipe:1",
+                ])
+
+            returncode, stdout, stderr = self._ffmpeg_pool.run(mp3_bytes)
+            if returncode != 0:
+                raise RuntimeError(f"ffmpeg failed: {stderr.decode(errors='ignore')}")
+
+            # Load WAV into numpy array straight from the pipe output.
+            # Ask libsndfile for float32 directly: the default float64
+            # doubles the buffer and forces a second conversion pass.
+            # -ac 1 above guarantees mono, so the 1D result needs no
+            # asarray copy or .mean(axis=1) downmix pass either.
+            audio_data, sr = sf.read(io.BytesIO(stdout), dtype="float32",
+                                     always_2d=False)
             return audio_data
 
         except Exception as e:
-            print(f"Error during gTTS synthesis: {e}")
+            print(f"Error decoding synthesized audio: {e}")
+            return np.array([])
+
+    def _crossfade_concat(self, pieces, fade_ms: float = 2.0) -> np.ndarray:
+        """Concatenate audio pieces with a short linear crossfade at joins."""
+        n = int(self.sample_rate * fade_ms / 1000.0)
+        out = pieces[0].copy()  # copy: pieces may be shared cache entries
+        for piece in pieces[1:]:
+            k = min(n, len(out), len(piece))
+            if k > 0:
+                ramp = np.linspace(0.0, 1.0, k, dtype=np.float32)
+                out[-k:] = out[-k:] * (1.0 - ramp) + piece[:k] * ramp
+                out = np.concatenate([out, piece[k:]])
+            else:
+                out = np.concatenate([out, piece])
+        return out
+
+    def _decode_mp3(self, mp3_bytes: bytes) -> np.ndarray:
+        """Decode MP3 bytes to mono float32 at ``self.sample_rate`` via PyAV."""
+        container = av.open(io.BytesIO(mp3_bytes))
+        resampler = av.AudioResampler(format="flt", layout="mono", rate=self.sample_rate)
+        chunks = []
+        for frame in container.decode(audio=0):
+            resampled = resampler.resample(frame)
+            if not isinstance(resampled, list):  # PyAV < 10 returns one frame
+                resampled = [resampled]
+            for out in resampled:
+                chunks.append(out.to_ndarray().reshape(-1))
+        container.close()
+        if not chunks:
             return np.array([])
+        return np.concatenate(chunks).astype(np.float32, copy=False)
+
+    def synthesize_stream(self, text: str) -> Iterator[np.ndarray]:
+        """Yield synthesized audio incrementally, one sentence at a time.
+
+        Both backends naturally synthesize sentence-by-sentence, so callers
+        can start sending or playing the first sentence while the rest of
+        the text is still being synthesized.
+        """
+        if not text or not text.strip():
+            return
+
+        sentences = re.split(r"(?<=[.!?…])\s+", text.strip())
+        for sentence in sentences:
+            if not sentence.strip():
+                continue
+            audio_data = self.synthesize(sentence)
+            if audio_data is not None and len(audio_data) > 0:
+                yield audio_data
 
     def synthesize_to_file(self, text: str, output_path: str):
         """Synthesize speech and save to a WAV file."""
@@ -166,26 +579,22 @@ class RussianTextToSpeech:
             return
 
         try:
-            # Normalize and ensure float32
+            # Normalize and ensure float32. Peak via max/-min skips the
+            # |x| temp buffer, and the old code walked the array for the
+            # peak twice; one scaled multiply (out-of-place: the input
+            # may be a shared cached array) finishes the job.
             audio_data = np.asarray(audio_data, dtype=np.float32)
-            if np.max(np.abs(audio_data)) > 0:
-                audio_data = audio_data / np.max(np.abs(audio_data)) * 0.9
-
-            # Write to temporary WAV
-            temp_wav = os.path.join(self.temp_dir, f"play_{int(time.time()*1000)}.wav")
-            sf.write(temp_wav, audio_data, self.sample_rate)
-
-            # Play via pygame
-            pygame.mixer.music.load(temp_wav)
-            pygame.mixer.music.play()
-
-            while pygame.mixer.music.get_busy():
-                pygame.time.Clock().tick(10)
-
-            try:
-                os.remove(temp_wav)
-            except OSError:
-                pass
+            peak = max(audio_data.max(initial=0.0), -audio_data.min(initial=0.0))
+            if peak > 0:
+                audio_data = audio_data * np.float32(0.9 / peak)
+
+            # Quantize to int16 and hand the buffer straight to the mixer
+            # (initialized mono/-16 at self.sample_rate): no WAV encode,
+            # no temp file, no disk round-trip
+            pcm = (audio_data * 32767.0).astype(np.int16)
+            pg = _pg(self.sample_rate)
+            channel = pg.mixer.Sound(buffer=pcm.tobytes()).play()
+            _wait_for_channel(channel, len(pcm) / self.sample_rate)
 
         except Exception as e:
             print(f"Error playing audio via pygame: {e}")
@@ -196,27 +605,92 @@ class RussianTextToSpeech:
         if audio_data is not None and len(audio_data) > 0:
             self.play_audio(audio_data)
 
+    def _fade_edges(self, audio_data: np.ndarray, fade_ms: float = 2.0) -> np.ndarray:
+        """Apply a short linear fade-in/out so chunk joins don't click."""
+        n = int(self.sample_rate * fade_ms / 1000.0)
+        if n == 0 or len(audio_data) < 2 * n:
+            return audio_data
+        audio_data = audio_data.copy()  # cached arrays are shared, never mutate
+        ramp = np.linspace(0.0, 1.0, n, dtype=np.float32)
+        audio_data[:n] *= ramp
+        audio_data[-n:] *= ramp[::-1]
+        return audio_data
+
+    def speak_streaming(self, text: str):
+        """Play audio as synthesis produces it, sentence by sentence.
+
+        A producer thread runs synthesize_stream and hands PCM chunks to
+        the playback loop through a small bounded queue, so time-to-first-
+        audio is one sentence's synthesis instead of the whole utterance's,
+        and sentence N+1 synthesizes while sentence N plays.
+        """
+        if not text or not text.strip():
+            return
+
+        chunk_queue = queue.Queue(maxsize=4)
+
+        def produce():
+            try:
+                for chunk in self.synthesize_stream(text):
+                    pcm = (np.clip(chunk, -1.0, 1.0) * 32767.0).astype(np.int16)
+                    chunk_queue.put(pcm)
+            finally:
+                chunk_queue.put(None)  # end-of-stream marker
+
+        threading.Thread(target=produce, daemon=True).start()
+
+        try:
+            # Blocking writes pace playback off the device clock; no
+            # callback/ring machinery needed
+            with sd.OutputStream(samplerate=self.sample_rate, channels=1,
+                                 dtype='int16') as stream:
+                while True:
+                    pcm = chunk_queue.get()
+                    if pcm is None:
+                        break
+                    stream.write(pcm)
+        except Exception as e:
+            print(f"Error during streaming playback: {e}")
+
+    def speak_many(self, texts):
+        """Synthesize and play a sequence of chunks with one-ahead pipelining.
+
+        While chunk N plays, chunk N+1 is already synthesizing on a
+        dedicated worker, so synthesis latency hides behind playback and
+        multi-sentence utterances flow without inter-chunk silence.
+        """
+        texts = [t for t in texts if t and t.strip()]
+        if not texts:
+            return
+
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts-ahead")
+        try:
+            ahead = pool.submit(self.synthesize, texts[0])
+            for i in range(len(texts)):
+                audio_data = ahead.result()
+                if i + 1 < len(texts):
+                    ahead = pool.submit(self.synthesize, texts[i + 1])
+                if audio_data is not None and len(audio_data) > 0:
+                    self.play_audio(self._fade_edges(audio_data))
+        finally:
+            pool.shutdown(wait=False)
+
     def stop_tts(self):
         """Stop background TTS processing and any playback."""
-        self.is_speaking = False
-        if _PYGAME_ENABLED:
+        self._pool.shutdown(wait=False)
+        if _PYGAME_ENABLED and _pygame is not None:
             try:
-                pygame.mixer.music.stop()
+                _pygame.mixer.stop()
             except Exception:
                 pass
 
-        if self.tts_thread is not None:
-            self.tts_thread.join(timeout=1.0)
-
 
 class AudioPlayer:
     """Simple audio player for TTS output using pygame."""
 
     def __init__(self, sample_rate: int = 22050):
         self.sample_rate = sample_rate
-        # Safe to call even if mixer already initialized
-        if _PYGAME_ENABLED and not pygame.mixer.get_init():
-            pygame.mixer.init(frequency=self.sample_rate, size=-16, channels=1, buffer=512)
+        # pygame + mixer init happen lazily on the first play() - see _pg()
 
     def play(self, audio_data: np.ndarray):
         """Play audio data (blocking) using pygame."""
@@ -227,32 +701,26 @@ class AudioPlayer:
             return
 
         try:
+            # Same single-pass normalization as play_audio above
             audio_data = np.asarray(audio_data, dtype=np.float32)
-            if np.max(np.abs(audio_data)) > 0:
-                audio_data = audio_data / np.max(np.abs(audio_data)) * 0.9
+            peak = max(audio_data.max(initial=0.0), -audio_data.min(initial=0.0))
+            if peak > 0:
+                audio_data = audio_data * np.float32(0.9 / peak)
 
-            temp_wav = os.path.join(tempfile.gettempdir(), f"player_{int(time.time()*1000)}.wav")
-            sf.write(temp_wav, audio_data, self.sample_rate)
-
-            pygame.mixer.music.load(temp_wav)
-            pygame.mixer.music.play()
-
-            while pygame.mixer.music.get_busy():
-                pygame.time.Clock().tick(10)
-
-            try:
-                os.remove(temp_wav)
-            except OSError:
-                pass
+            # In-memory playback, same as RussianTextToSpeech.play_audio
+            pcm = (audio_data * 32767.0).astype(np.int16)
+            pg = _pg(self.sample_rate)
+            channel = pg.mixer.Sound(buffer=pcm.tobytes()).play()
+            _wait_for_channel(channel, len(pcm) / self.sample_rate)
 
         except Exception as e:
             print(f"AudioPlayer error: {e}")
 
     def close(self):
         """Placeholder for API compatibility; pygame handles mixer shutdown globally."""
-        if _PYGAME_ENABLED:
+        if _PYGAME_ENABLED and _pygame is not None:
             try:
-                pygame.mixer.music.stop()
+                _pygame.mixer.stop()
             except Exception:
                 pass
 